@@ -0,0 +1,89 @@
+import time
+from PIL import Image
+import DataManager
+import EventBus
+import LogicManager
+import OverlayRenderer
+
+
+# ============================================================================
+# BENCHMARK - Measures hot paths that must keep up with the UI
+# ============================================================================
+def bench_overlay(width=1920, height=1080, frames=600):
+    """Measure overlay frames per second with a health change every frame."""
+    background = Image.effect_noise((800, 600), 64).convert('RGB')
+    sink = OverlayRenderer.SharedMemorySink(f"dnd_bench_{time.time_ns()}", width, height)
+    renderer = OverlayRenderer.OverlayRenderer(width, height, [sink])
+    try:
+        renderer.set_background(background)
+        renderer.update_health(100, 100, "Ornstein")
+        renderer.emit()
+
+        start = time.perf_counter()
+        for i in range(frames):
+            name = "Ornstein" if (i // 30) % 2 == 0 else "Smough"
+            renderer.update_health(100 - i % 100, 100, name)
+            renderer.emit()
+        elapsed = time.perf_counter() - start
+    finally:
+        sink.close()
+    return frames / elapsed
+
+
+def bench_dispatch(events=100000):
+    """Measure publish() overhead per event, in microseconds, for each subscriber mode."""
+    results = {}
+    for mode in ('none', 'inline', 'thread'):
+        bus = EventBus.EventBus()
+        if mode != 'none':
+            bus.subscribe(EventBus.HealthChanged, lambda event: None, mode=mode)
+        event = EventBus.HealthChanged("Ornstein", 50, 100)
+        start = time.perf_counter()
+        for _ in range(events):
+            bus.publish(event)
+        results[mode] = (time.perf_counter() - start) / events * 1e6
+        bus.close()
+    return results
+
+
+def bench_slow_subscriber(presses=2000, delay=0.005):
+    """Measure apply_damage() latency while a slow threaded subscriber is attached."""
+    data_manager = DataManager.DataManager()
+    logic_manager = LogicManager.LogicManager(data_manager)
+    delivered = []
+
+    def slow_subscriber(event):
+        time.sleep(delay)
+        delivered.append(event)
+
+    logic_manager.event_bus.subscribe(EventBus.HealthChanged, slow_subscriber, mode='thread')
+    logic_manager.initialize_monster("Ornstein", presses + 1)
+
+    latencies = []
+    for _ in range(presses):
+        start = time.perf_counter()
+        logic_manager.apply_damage(1)
+        latencies.append(time.perf_counter() - start)
+    logic_manager.event_bus.close()
+
+    mean = sum(latencies) / len(latencies) * 1e6
+    worst = max(latencies) * 1e6
+    return mean, worst, len(delivered)
+
+
+def main():
+    """Run all benchmarks and print the results."""
+    fps = bench_overlay()
+    print(f"overlay 1920x1080: {fps:.0f} fps")
+    
+    dispatch = bench_dispatch()
+    for mode, cost in dispatch.items():
+        print(f"publish, {mode} subscriber: {cost:.2f} us/event")
+    
+    mean, worst, delivered = bench_slow_subscriber()
+    print(f"apply_damage with 5 ms threaded subscriber: mean {mean:.1f} us, max {worst:.1f} us, "
+          f"{delivered} coalesced deliveries")
+
+
+if __name__ == "__main__":
+    main()
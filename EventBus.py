@@ -0,0 +1,316 @@
+import asyncio
+import itertools
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+
+# ============================================================================
+# EVENTS - Typed notifications published by the LogicManager
+# ============================================================================
+@dataclass(frozen=True)
+class Event:
+    """Base class for all events.
+
+    Events with coalesce = True describe the latest state, so a subscriber
+    that falls behind only needs the newest one. Other events are discrete
+    and are always delivered.
+    """
+    coalesce: ClassVar[bool] = False
+
+
+@dataclass(frozen=True)
+class HealthChanged(Event):
+    """The monster's name or health changed."""
+    coalesce: ClassVar[bool] = True
+    name: str
+    current: int
+    maximum: int
+
+
+@dataclass(frozen=True)
+class AbilitiesChanged(Event):
+    """The ability list or any ability's remaining uses changed."""
+    coalesce: ClassVar[bool] = True
+    abilities: dict = field(default_factory=dict)  # {name: (max_uses, current_uses)}
+
+
+@dataclass(frozen=True)
+class AbilityUsed(Event):
+    """An ability was used. remaining is None for unlimited abilities."""
+    name: str
+    remaining: object = None
+
+
+@dataclass(frozen=True)
+class BackgroundChanged(Event):
+    """The background image was set (path) or cleared (None)."""
+    coalesce: ClassVar[bool] = True
+    path: object = None
+
+
+@dataclass(frozen=True)
+class BackgroundImageLoaded(Event):
+    """The UI decoded the background image (None when cleared).
+
+    Published by the UI after it has handled BackgroundChanged, so consumers
+    such as the overlay can reuse the full-resolution image instead of
+    decoding the file again.
+    """
+    coalesce: ClassVar[bool] = True
+    path: object = None
+    image: object = None
+
+
+@dataclass(frozen=True)
+class MonsterLoaded(Event):
+    """A monster was loaded from a file."""
+    filename: str
+    name: str
+
+
+@dataclass(frozen=True)
+class MonsterSaved(Event):
+    """The monster was saved to a file."""
+    filename: str
+
+
+# ============================================================================
+# EVENT BUS - Publish/subscribe dispatch
+# ============================================================================
+class Subscription:
+    """Handle returned by EventBus.subscribe."""
+
+    def __init__(self, bus, event_type, dispatcher):
+        self.bus = bus
+        self.event_type = event_type
+        self.dispatcher = dispatcher
+
+    def cancel(self):
+        """Stop receiving events.
+
+        Never waits for the subscriber: a worker thread delivers the events
+        already queued for it and then exits on its own.
+        """
+        self.bus._remove(self)
+
+
+class _InlineDispatcher:
+    """Calls the subscriber immediately on the publishing thread.
+
+    Exceptions propagate to the publisher, exactly as a direct call would,
+    so errors in Tk handlers still reach Tk's report_callback_exception.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def dispatch(self, event):
+        """Call the subscriber. Always returns True."""
+        self.callback(event)
+        return True
+
+    def close(self):
+        pass
+
+    def join(self, timeout=None):
+        return True
+
+
+class _CoalescingQueue:
+    """Pending events for one subscriber, keeping only the newest state event per type."""
+
+    def __init__(self):
+        self.pending = {}
+        self._counter = itertools.count()
+
+    def put(self, event):
+        """Add an event. Returns True if the queue was empty."""
+        was_empty = not self.pending
+        key = type(event) if event.coalesce else next(self._counter)
+        self.pending.pop(key, None)  # Move a coalesced event to its new arrival position
+        self.pending[key] = event
+        return was_empty
+
+    def take(self):
+        """Remove and return all pending events in arrival order."""
+        events = list(self.pending.values())
+        self.pending = {}
+        return events
+
+
+class _ThreadDispatcher:
+    """Delivers events to the subscriber on its own worker thread."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.queue = _CoalescingQueue()
+        self.condition = threading.Condition()
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def dispatch(self, event):
+        """Queue an event for the worker. Returns False once closed."""
+        with self.condition:
+            if self.closed:
+                return False
+            if self.queue.put(event):
+                self.condition.notify()
+        return True
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.queue.pending and not self.closed:
+                    self.condition.wait()
+                if not self.queue.pending:
+                    return  # Closed, and everything published has been delivered
+                events = self.queue.take()
+            for event in events:
+                try:
+                    self.callback(event)
+                except Exception:
+                    traceback.print_exc()
+
+    def close(self):
+        """Stop accepting events. The worker delivers what is queued, then exits."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def join(self, timeout=None):
+        """Wait for the worker to exit. Returns False if it is still running."""
+        if threading.current_thread() is not self.thread:
+            self.thread.join(timeout)
+        return not self.thread.is_alive()
+
+
+class _AsyncioDispatcher:
+    """Delivers events to the subscriber on an asyncio event loop.
+
+    The callback may be a plain function or a coroutine function. Once the
+    loop is closed the dispatcher shuts down instead of raising into the
+    publisher.
+    """
+
+    def __init__(self, callback, loop):
+        self.callback = callback
+        self.loop = loop
+        self.queue = _CoalescingQueue()
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def dispatch(self, event):
+        """Queue an event. Returns False if the dispatcher is shut down."""
+        with self.lock:
+            if self.closed:
+                return False
+            schedule = self.queue.put(event)
+        if schedule:
+            try:
+                self.loop.call_soon_threadsafe(self._drain)
+            except RuntimeError:
+                # The subscriber's event loop is closed
+                self.close()
+                return False
+        return True
+
+    def _drain(self):
+        with self.lock:
+            events = self.queue.take()
+        for event in events:
+            try:
+                result = self.callback(event)
+                if asyncio.iscoroutine(result):
+                    task = self.loop.create_task(result)
+                    task.add_done_callback(self._report_task_error)
+            except Exception:
+                traceback.print_exc()
+
+    def _report_task_error(self, task):
+        """Log an exception raised by a coroutine subscriber."""
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.queue.take()
+
+    def join(self, timeout=None):
+        return True
+
+
+class EventBus:
+    """Routes typed events from publishers to subscribers.
+
+    Subscribers choose where they run:
+      - 'inline':  synchronously inside publish(); keep these fast, they run
+                   on the publisher's (usually the Tk) thread
+      - 'thread':  on a dedicated worker thread
+      - 'asyncio': on the given asyncio event loop
+    Thread and asyncio subscribers never block the publisher, and any state
+    events that pile up while they are busy are coalesced to the newest one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # {event type: tuple of subscriptions}
+
+    def subscribe(self, event_type, callback, mode='inline', loop=None):
+        """Subscribe a callback to an event type (and its subclasses)."""
+        if mode == 'inline':
+            dispatcher = _InlineDispatcher(callback)
+        elif mode == 'thread':
+            dispatcher = _ThreadDispatcher(callback)
+        elif mode == 'asyncio':
+            if loop is None:
+                raise ValueError("An asyncio subscriber needs an event loop")
+            dispatcher = _AsyncioDispatcher(callback, loop)
+        else:
+            raise ValueError(f"Unknown subscriber mode: {mode}")
+
+        subscription = Subscription(self, event_type, dispatcher)
+        with self._lock:
+            # Copy on write so publish() can read without locking
+            self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (subscription,)
+        return subscription
+
+    def _remove(self, subscription):
+        """Remove a subscription and stop its dispatcher."""
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.event_type, ())
+            remaining = tuple(s for s in subscriptions if s is not subscription)
+            if len(remaining) == len(subscriptions):
+                return
+            self._subscribers[subscription.event_type] = remaining
+        subscription.dispatcher.close()
+
+    def publish(self, event):
+        """Deliver an event to every subscriber of its type."""
+        subscribers = self._subscribers
+        for event_type in type(event).__mro__:
+            for subscription in subscribers.get(event_type, ()):
+                if not subscription.dispatcher.dispatch(event):
+                    subscription.cancel()  # The subscriber can no longer receive events
+
+    def close(self, timeout=1.0):
+        """Cancel all subscriptions, waiting up to timeout seconds for queued events.
+
+        Returns False if some worker was still busy when the time ran out.
+        """
+        with self._lock:
+            subscriptions = [s for subs in self._subscribers.values() for s in subs]
+            self._subscribers = {}
+        for subscription in subscriptions:
+            subscription.dispatcher.close()
+        deadline = time.monotonic() + timeout
+        finished = True
+        for subscription in subscriptions:
+            remaining = max(0, deadline - time.monotonic())
+            finished = subscription.dispatcher.join(remaining) and finished
+        return finished
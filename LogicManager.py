@@ -3,17 +3,17 @@ from tkinter import ttk, messagebox, filedialog
 import json
 import os
 from PIL import Image, ImageTk
+from EventBus import (
+    EventBus, HealthChanged, AbilitiesChanged, AbilityUsed,
+    BackgroundChanged, MonsterLoaded, MonsterSaved
+)
 
 class LogicManager:
-    """Manages the application logic and coordinates between UI and data."""
+    """Manages the application logic and publishes changes to its consumers."""
     
-    def __init__(self, data_manager):
+    def __init__(self, data_manager, event_bus=None):
         self.data_manager = data_manager
-        self.ui_manager = None  # Will be set after UI initialization
-    
-    def set_ui_manager(self, ui_manager):
-        """Set the UI manager reference."""
-        self.ui_manager = ui_manager
+        self.event_bus = event_bus or EventBus()
     
     def initialize_monster(self, name, max_health):
         """Initialize a new monster with the given stats."""
@@ -22,7 +22,7 @@ class LogicManager:
             self.data_manager.set_monster_name(name)
             self.data_manager.set_max_health(max_health)
             self.data_manager.set_current_health(max_health)
-            self.update_ui()
+            self.publish_health()
             return True
         except ValueError:
             return False
@@ -33,7 +33,7 @@ class LogicManager:
             amount = int(amount)
             current = self.data_manager.get_current_health()
             self.data_manager.set_current_health(current - amount)
-            self.update_ui()
+            self.publish_health()
             return True
         except ValueError:
             return False
@@ -44,7 +44,7 @@ class LogicManager:
             amount = int(amount)
             current = self.data_manager.get_current_health()
             self.data_manager.set_current_health(current + amount)
-            self.update_ui()
+            self.publish_health()
             return True
         except ValueError:
             return False
@@ -56,7 +56,7 @@ class LogicManager:
         try:
             uses_count = int(uses) if uses else 0
             self.data_manager.add_ability(name, uses_count)
-            self.ui_manager.update_abilities_display()
+            self.publish_abilities()
             return True
         except ValueError:
             return False
@@ -65,52 +65,68 @@ class LogicManager:
         """Use an ability."""
         success = self.data_manager.use_ability(ability_name)
         if success:
-            self.ui_manager.update_abilities_display()
+            max_uses, current_uses = self.data_manager.get_abilities()[ability_name]
+            remaining = current_uses if max_uses > 0 else None
+            self.event_bus.publish(AbilityUsed(ability_name, remaining))
+            self.publish_abilities()
         return success
     
     def remove_ability(self, ability_name):
         """Remove an ability."""
         self.data_manager.remove_ability(ability_name)
-        self.ui_manager.update_abilities_display()
+        self.publish_abilities()
     
     def reset_monster(self):
         """Reset the monster to full health and restore abilities."""
         max_health = self.data_manager.get_max_health()
         self.data_manager.set_current_health(max_health)
         self.data_manager.reset_abilities()
-        self.update_ui()
+        self.publish_health()
+        self.publish_abilities()
     
     def set_background_image(self, path):
         """Set the background image."""
         self.data_manager.set_background_image(path)
-        self.ui_manager.update_background_image(path)
+        self.event_bus.publish(BackgroundChanged(path))
     
     def clear_background_image(self):
         """Clear the background image."""
         self.data_manager.set_background_image(None)
-        self.ui_manager.update_background_image(None)
+        self.event_bus.publish(BackgroundChanged(None))
     
     def save_monster(self, filename):
         """Save the monster to a file."""
-        return self.data_manager.save_to_file(filename)
+        success = self.data_manager.save_to_file(filename)
+        if success:
+            self.event_bus.publish(MonsterSaved(filename))
+        return success
     
     def load_monster(self, filename):
         """Load a monster from a file."""
         success = self.data_manager.load_from_file(filename)
         if success:
-            self.update_ui()
-            self.ui_manager.update_abilities_display()
+            self.publish_health()
+            self.publish_abilities()
             bg_image = self.data_manager.get_background_image()
-            self.ui_manager.update_background_image(bg_image)
+            self.event_bus.publish(BackgroundChanged(bg_image))
+            name = self.data_manager.get_monster_name()
+            self.event_bus.publish(MonsterLoaded(filename, name))
         return success
     
-    def update_ui(self):
-        """Update all UI elements with current data."""
-        if self.ui_manager:
-            name = self.data_manager.get_monster_name()
-            current = self.data_manager.get_current_health()
-            maximum = self.data_manager.get_max_health()
-            self.ui_manager.update_health_display(current, maximum, name)
+    def publish_health(self):
+        """Publish the current name and health."""
+        name = self.data_manager.get_monster_name()
+        current = self.data_manager.get_current_health()
+        maximum = self.data_manager.get_max_health()
+        self.event_bus.publish(HealthChanged(name, current, maximum))
+    
+    def publish_abilities(self):
+        """Publish a snapshot of all abilities."""
+        abilities = {
+            name: (max_uses, current_uses)
+            for name, (max_uses, current_uses) in self.data_manager.get_abilities().items()
+        }
+        self.event_bus.publish(AbilitiesChanged(abilities))
     
     def get_abilities_list(self):
         """Get formatted abilities list for display."""
@@ -1,13 +1,59 @@
+import argparse
+import sys
 import DataManager
 import LogicManager
+import OverlayRenderer
 import UIManager
 import tkinter as tk
 # ============================================================================
 # MAIN APPLICATION
 # ============================================================================
+def parse_size(value):
+    """Parse a WIDTHxHEIGHT size argument."""
+    try:
+        width, height = (int(v) for v in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got '{value}'")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive, got '{value}'")
+    return width, height
+
+
+def parse_overlay(value):
+    """Validate an overlay output spec."""
+    try:
+        OverlayRenderer.parse_sink_spec(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Dungeon Master monster tracker")
+    parser.add_argument(
+        "--overlay", type=parse_overlay, action="append", default=[], metavar="OUTPUT",
+        help="Render the boss bar offscreen to shm:NAME, pipe:PATH or png:DIR (repeatable)"
+    )
+    parser.add_argument("--overlay-size", type=parse_size, default="1920x1080", help="Overlay frame size, WIDTHxHEIGHT")
+    parser.add_argument("--overlay-fps", type=int, default=60, help="Overlay frame rate")
+    return parser.parse_args()
+
+
 def main():
     """Initialize and
     run the application."""
+    args = parse_args()
+    
+    # Open overlay outputs before any window exists
+    sinks = []
+    if args.overlay:
+        width, height = args.overlay_size
+        try:
+            sinks = OverlayRenderer.create_sinks(args.overlay, width, height)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Error: could not open overlay output: {e}")
+    
     root = tk.Tk()
     
     # Create managers
@@ -15,11 +61,20 @@ def main():
     logic_manager = LogicManager.LogicManager(data_manager)
     ui_manager = UIManager.UIManager(root, logic_manager)
     
-    # Connect logic manager to UI
-    logic_manager.set_ui_manager(ui_manager)
+    # Optional offscreen overlay for streaming
+    overlay_renderer = None
+    if sinks:
+        overlay_renderer = OverlayRenderer.OverlayRenderer(width, height, sinks)
+        ui_manager.attach_overlay_renderer(overlay_renderer)
+        overlay_renderer.start(args.overlay_fps)
     
     root.mainloop()
+    
+    if overlay_renderer:
+        ui_manager.detach_overlay_renderer()
+        overlay_renderer.stop()
+    logic_manager.event_bus.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
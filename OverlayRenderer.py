@@ -0,0 +1,476 @@
+import os
+import stat
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from PIL import Image, ImageDraw, ImageFont
+
+
+# ============================================================================
+# OVERLAY RENDERER - Draws the boss health bar offscreen for streaming
+# ============================================================================
+
+# Layout of HealthBarWindow, in its own 800x600 coordinate space
+BASE_WIDTH = 800
+BASE_HEIGHT = 600
+NAME_CENTER = (400, 510)
+NAME_FONT_SIZE = 27  # Georgia 20pt bold at 96 dpi
+NAME_COLOR = '#E8E8E8'
+BAR_BOX = (50, 535, 750, 555)
+BAR_BACKGROUND = '#1a1a1a'
+
+FONT_CANDIDATES = (
+    "georgiab.ttf",
+    "Georgia Bold.ttf",
+    "DejaVuSerif-Bold.ttf",
+    "LiberationSerif-Bold.ttf",
+)
+
+
+def health_bar_color(percentage):
+    """Get the Dark Souls-style bar color for a health percentage."""
+    if percentage > 0.6:
+        return '#8B0000'
+    elif percentage > 0.3:
+        return '#A52A2A'
+    return '#5C0000'
+
+
+def _load_font(size):
+    """Load the boss name font, falling back to PIL's built-in font."""
+    for candidate in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _union(a, b):
+    """Return the bounding box covering two boxes (either may be None)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _intersects(a, b):
+    """Check whether two boxes overlap."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class OverlayRenderer:
+    """Renders the boss health bar into an offscreen frame buffer.
+
+    Mirrors the composition of HealthBarWindow (background, boss name and
+    health bar) at an arbitrary output size. State updates are cheap and
+    thread-safe; the actual drawing happens in render(), which only repaints
+    the rectangles that changed since the previous frame.
+    """
+
+    def __init__(self, width=1920, height=1080, sinks=None):
+        self.width = width
+        self.height = height
+        self.sinks = list(sinks or [])
+
+        # Scale the window layout uniformly and anchor it to the bottom centre
+        scale = min(width / BASE_WIDTH, height / BASE_HEIGHT)
+        self.layout_size = (round(BASE_WIDTH * scale), round(BASE_HEIGHT * scale))
+        self.layout_origin = ((width - self.layout_size[0]) // 2, height - self.layout_size[1])
+        ox, oy = self.layout_origin
+        self.name_center = (ox + round(NAME_CENTER[0] * scale), oy + round(NAME_CENTER[1] * scale))
+        self.bar_box = (
+            ox + round(BAR_BOX[0] * scale), oy + round(BAR_BOX[1] * scale),
+            ox + round(BAR_BOX[2] * scale), oy + round(BAR_BOX[3] * scale)
+        )
+        self.font = _load_font(max(1, round(NAME_FONT_SIZE * scale)))
+
+        # Pending state, written by the UI thread
+        self._lock = threading.Lock()
+        self._name = ''
+        self._current = None  # None until the first update, like the Tk window
+        self._maximum = None
+        self._background = None
+        self._background_dirty = True
+
+        # Drawn state, owned by whoever calls render()
+        self.frame = Image.new('RGB', (width, height), 'black')
+        self._draw = ImageDraw.Draw(self.frame)
+        self._base = self.frame.copy()
+        self._drawn_name = None
+        self._drawn_name_box = None
+        self._drawn_bar = None
+        self._drawn_dead = None
+        self.frame_index = 0
+
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    # State updates (safe to call from the Tk thread)
+    def update_health(self, current, maximum, name):
+        """Update the health and name shown in the next frame."""
+        with self._lock:
+            self._current = current
+            self._maximum = maximum
+            self._name = name
+
+    def set_background(self, image):
+        """Set the background from an already decoded PIL image (or None)."""
+        with self._lock:
+            self._background = image
+            self._background_dirty = True
+
+    # Rendering
+    def render(self):
+        """Bring the frame buffer up to date. Returns the dirty rectangles."""
+        with self._lock:
+            name = self._name
+            current = self._current
+            maximum = self._maximum
+            background = self._background
+            background_dirty = self._background_dirty
+            self._background_dirty = False
+
+        if background_dirty:
+            self._base = self._compose_base(background)
+
+        dead = current is not None and current <= 0
+        if current is None:
+            bar = (self.bar_box[2], health_bar_color(1.0))
+        else:
+            percentage = max(0, current / maximum) if maximum > 0 else 0
+            bar_width = round((self.bar_box[2] - self.bar_box[0]) * percentage)
+            bar = (self.bar_box[0] + bar_width, health_bar_color(percentage))
+
+        if background_dirty or dead != self._drawn_dead:
+            self._repaint_all(name, bar, dead)
+            return [(0, 0, self.width, self.height)]
+        if dead:
+            return []
+
+        dirty = []
+        if name != self._drawn_name:
+            new_box = self._name_box(name)
+            region = _union(self._drawn_name_box, new_box)
+            if region is not None:
+                self.frame.paste(self._base.crop(region), region[:2])
+                dirty.append(region)
+                if _intersects(region, self.bar_box):
+                    self._drawn_bar = None
+            self._draw_name(name, new_box)
+        if bar != self._drawn_bar:
+            self._draw_bar(bar)
+            dirty.append(self.bar_box)
+        return dirty
+
+    def emit(self):
+        """Render the next frame and hand it to every sink."""
+        dirty = self.render()
+        if dirty:
+            self.frame_index += 1
+        for sink in self.sinks:
+            sink.write_frame(self.frame, dirty)
+        return dirty
+
+    def _compose_base(self, background):
+        """Build the static layer (background only) at the output size."""
+        base = Image.new('RGB', (self.width, self.height), 'black')
+        if background is None:
+            return base
+        if background.mode != 'RGB':
+            background = background.convert('RGB')
+        if background.size != self.layout_size:
+            background = background.resize(self.layout_size, Image.Resampling.LANCZOS)
+        base.paste(background, self.layout_origin)
+        return base
+
+    def _repaint_all(self, name, bar, dead):
+        """Redraw the whole frame."""
+        if dead:
+            # Death animation - fade to black
+            self._draw.rectangle((0, 0, self.width, self.height), fill='black')
+            self._drawn_name = None
+            self._drawn_name_box = None
+            self._drawn_bar = None
+        else:
+            self.frame.paste(self._base, (0, 0))
+            self._draw_name(name, self._name_box(name))
+            self._draw_bar(bar)
+        self._drawn_dead = dead
+
+    def _name_box(self, name):
+        """Get the pixel box covered by the boss name, or None if empty."""
+        if not name:
+            return None
+        box = self._draw.textbbox(self.name_center, name, font=self.font, anchor='mm')
+        box = (max(0, box[0]), max(0, box[1]), min(self.width, box[2]), min(self.height, box[3]))
+        return box if box[0] < box[2] and box[1] < box[3] else None
+
+    def _draw_name(self, name, box):
+        """Draw the boss name over the base layer."""
+        if box is not None:
+            self._draw.text(self.name_center, name, font=self.font, fill=NAME_COLOR, anchor='mm')
+        self._drawn_name = name
+        self._drawn_name_box = box
+
+    def _draw_bar(self, bar):
+        """Draw the health bar track and fill."""
+        right, color = bar
+        x0, y0, x1, y1 = self.bar_box
+        self._draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=BAR_BACKGROUND)
+        if right > x0:
+            self._draw.rectangle((x0, y0, right - 1, y1 - 1), fill=color)
+        self._drawn_bar = bar
+
+    # Frame pump
+    def start(self, fps=60):
+        """Start emitting frames at the given rate on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(fps,), daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Stop the frame pump and close all sinks.
+
+        Returns False if the render thread is still busy after the timeout;
+        it then closes the sinks itself once its current frame is done.
+        """
+        if self._thread is None:
+            self._close_sinks()
+            return True
+        self._stop_event.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            return False
+        self._thread = None
+        return True
+
+    def _close_sinks(self):
+        """Close every sink, logging any failure."""
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                print(f"Error closing overlay output: {e}")
+
+    def _run(self, fps):
+        """Emit frames on a fixed schedule until stopped, then close the sinks."""
+        period = 1.0 / fps
+        next_time = time.monotonic()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self.emit()
+                except Exception as e:
+                    print(f"Error rendering overlay frame: {e}")
+                next_time += period
+                delay = next_time - time.monotonic()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                else:
+                    next_time = time.monotonic()  # Fell behind, don't try to catch up
+        finally:
+            self._close_sinks()
+
+
+# ============================================================================
+# FRAME SINKS - Deliver rendered frames to external consumers
+# ============================================================================
+class FrameSink:
+    """Base class for frame consumers."""
+
+    def write_frame(self, frame, dirty_rects):
+        """Receive the current frame and the rectangles changed since the last call."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the sink."""
+
+
+class SharedMemorySink(FrameSink):
+    """Writes RGB frames into a named shared-memory block.
+
+    Layout: a 24 byte header (magic b'DNDO', width, height, channels as
+    uint32 and a uint64 sequence number) followed by width*height*3 bytes of
+    RGB pixels. The sequence number is odd while a frame is being written,
+    so readers should retry if it is odd or changes while they copy.
+    """
+
+    HEADER = struct.Struct('<4sIIIQ')
+    MAGIC = b'DNDO'
+
+    def __init__(self, name, width, height):
+        self.width = width
+        self.height = height
+        self.stride = width * 3
+        size = self.HEADER.size + self.stride * height
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.created = True
+        except FileExistsError:
+            # Attach to a block created by the consumer; it owns its lifetime
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.created = False
+            if self.shm.size < size:
+                self.shm.close()
+                raise ValueError(f"Shared memory block '{name}' is too small")
+        self.sequence = 0
+        self._write_header()
+
+    def _write_header(self):
+        """Write the header with the current sequence number."""
+        self.HEADER.pack_into(self.shm.buf, 0, self.MAGIC, self.width, self.height, 3, self.sequence)
+
+    def write_frame(self, frame, dirty_rects):
+        """Copy the dirty rectangles into shared memory."""
+        if not dirty_rects:
+            return
+        buf = self.shm.buf
+        offset = self.HEADER.size
+        self.sequence += 1
+        self._write_header()
+        for rect in dirty_rects:
+            x0, y0, x1, y1 = rect
+            if (x0, y0, x1, y1) == (0, 0, self.width, self.height):
+                buf[offset:offset + self.stride * self.height] = frame.tobytes()
+                continue
+            data = frame.crop(rect).tobytes()
+            row_bytes = (x1 - x0) * 3
+            for row in range(y1 - y0):
+                start = offset + (y0 + row) * self.stride + x0 * 3
+                buf[start:start + row_bytes] = data[row * row_bytes:(row + 1) * row_bytes]
+        self.sequence += 1
+        self._write_header()
+
+    def close(self):
+        """Detach from the shared-memory block, removing it if this sink created it."""
+        self.shm.close()
+        if not self.created:
+            return
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class NamedPipeSink(FrameSink):
+    """Streams raw RGB frames into a named pipe (FIFO).
+
+    Every call writes a full frame, so the pipe carries a constant-rate
+    rawvideo stream (e.g. ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -r FPS).
+    The pipe is never written in blocking mode: frames are dropped while no
+    reader is connected, and while a reader is too slow to take the rest of
+    the previous frame.
+    """
+
+    def __init__(self, path):
+        if not hasattr(os, 'mkfifo'):
+            raise OSError("Named pipe output is not supported on this platform")
+        self.path = path
+        if not os.path.exists(path):
+            os.mkfifo(path)
+        elif not stat.S_ISFIFO(os.stat(path).st_mode):
+            raise ValueError(f"'{path}' exists and is not a named pipe")
+        self.fd = None
+        self._frame_bytes = None
+        self._unsent = None  # Remainder of a partially written frame
+
+    def _open(self):
+        """Try to connect to a reader. Returns True if connected."""
+        try:
+            self.fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError:
+            return False  # No reader yet
+        return True
+
+    def write_frame(self, frame, dirty_rects):
+        """Write as much of the frame as the pipe accepts without blocking."""
+        if dirty_rects or self._frame_bytes is None:
+            self._frame_bytes = frame.tobytes()
+        if self.fd is None and not self._open():
+            return
+        if self._unsent is None:
+            self._unsent = memoryview(self._frame_bytes)
+        try:
+            while self._unsent:
+                written = os.write(self.fd, self._unsent)
+                self._unsent = self._unsent[written:]
+            self._unsent = None
+        except BlockingIOError:
+            pass  # Finish this frame on a later call, dropping new ones meanwhile
+        except BrokenPipeError:
+            self.close()
+
+    def close(self):
+        """Close the pipe."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        self._unsent = None
+
+
+class PngSequenceSink(FrameSink):
+    """Writes a numbered PNG file for every frame that changed.
+
+    PNG encoding is far slower than the other sinks, so this is meant for
+    image-slideshow style consumers that only need the changed frames.
+    """
+
+    def __init__(self, directory, pattern="frame_{:06d}.png"):
+        self.directory = directory
+        self.pattern = pattern
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def write_frame(self, frame, dirty_rects):
+        """Save the frame if anything changed."""
+        if not dirty_rects:
+            return
+        path = os.path.join(self.directory, self.pattern.format(self.count))
+        frame.save(path, compress_level=1)
+        self.count += 1
+
+
+SINK_TYPES = ('shm', 'pipe', 'png')
+
+
+def parse_sink_spec(spec):
+    """Split a 'shm:NAME', 'pipe:PATH' or 'png:DIR' spec into (kind, target)."""
+    kind, _, target = spec.partition(':')
+    if kind not in SINK_TYPES:
+        raise ValueError(f"Unknown overlay output type '{kind}', expected one of {', '.join(SINK_TYPES)}")
+    if not target:
+        raise ValueError(f"Overlay output '{spec}' is missing a name or path")
+    if kind == 'pipe' and not hasattr(os, 'mkfifo'):
+        raise ValueError("Named pipe output is not supported on this platform")
+    return kind, target
+
+
+def create_sink(spec, width, height):
+    """Create a sink from a 'shm:NAME', 'pipe:PATH' or 'png:DIR' spec."""
+    kind, target = parse_sink_spec(spec)
+    if kind == 'shm':
+        return SharedMemorySink(target, width, height)
+    elif kind == 'pipe':
+        return NamedPipeSink(target)
+    return PngSequenceSink(target)
+
+
+def create_sinks(specs, width, height):
+    """Create a sink for every spec, closing the ones already made if any fails."""
+    sinks = []
+    try:
+        for spec in specs:
+            sinks.append(create_sink(spec, width, height))
+    except Exception:
+        for sink in sinks:
+            sink.close()
+        raise
+    return sinks
@@ -3,6 +3,7 @@ from tkinter import ttk, messagebox, filedialog
 import json
 import os
 from PIL import Image, ImageTk
+from EventBus import HealthChanged, AbilitiesChanged, BackgroundChanged, BackgroundImageLoaded
 
 # ============================================================================
 # UI MANAGER - Handles all UI components and user interactions
@@ -17,6 +18,46 @@ class UIManager:
         # Initialize windows
         self.stats_window = StatsWindow(root, self)
         self.health_bar_window = HealthBarWindow()
+        self.overlay_subscriptions = []
+        
+        # Subscribe inline: these handlers are fast and must run on the Tk thread
+        event_bus = logic_manager.event_bus
+        event_bus.subscribe(HealthChanged, self._on_health_changed)
+        event_bus.subscribe(AbilitiesChanged, self._on_abilities_changed)
+        event_bus.subscribe(BackgroundChanged, self._on_background_changed)
+    
+    def _on_health_changed(self, event):
+        """Handle a HealthChanged event."""
+        self.update_health_display(event.current, event.maximum, event.name)
+    
+    def _on_abilities_changed(self, event):
+        """Handle an AbilitiesChanged event."""
+        self.update_abilities_display()
+    
+    def _on_background_changed(self, event):
+        """Handle a BackgroundChanged event."""
+        self.update_background_image(event.path)
+    
+    def attach_overlay_renderer(self, renderer):
+        """Subscribe an offscreen overlay renderer to the logic manager's events."""
+        event_bus = self.logic_manager.event_bus
+        self.overlay_subscriptions = [
+            event_bus.subscribe(
+                HealthChanged,
+                lambda event: renderer.update_health(event.current, event.maximum, event.name)
+            ),
+            event_bus.subscribe(
+                BackgroundImageLoaded,
+                lambda event: renderer.set_background(event.image)
+            ),
+        ]
+        renderer.set_background(self.health_bar_window.bg_image)
+    
+    def detach_overlay_renderer(self):
+        """Stop sending events to the overlay renderer."""
+        for subscription in self.overlay_subscriptions:
+            subscription.cancel()
+        self.overlay_subscriptions = []
         
     def update_health_display(self, current, maximum, name):
         """Update health displays in both windows."""
@@ -31,6 +72,10 @@ class UIManager:
         """Update the background image in the health bar window."""
         self.health_bar_window.set_background_image(path)
         self.stats_window.update_image_label(path)
+        # Hand the decoded image to other consumers so they don't decode it again
+        self.logic_manager.event_bus.publish(
+            BackgroundImageLoaded(path, self.health_bar_window.bg_image)
+        )
 
 
 class HealthBarWindow:
@@ -45,6 +90,7 @@ class HealthBarWindow:
         self._setup_ui()
         
         self.bg_image_path = None
+        self.bg_image = None  # Full-resolution decoded image, shared with the overlay renderer
         self.bg_photo = None
     
     def _setup_ui(self):
@@ -103,8 +149,9 @@ class HealthBarWindow:
             try:
                 self.bg_image_path = image_path
                 img = Image.open(image_path)
-                img = img.resize((800, 600), Image.Resampling.LANCZOS)
-                self.bg_photo = ImageTk.PhotoImage(img)
+                img.load()
+                self.bg_image = img
+                self.bg_photo = ImageTk.PhotoImage(img.resize((800, 600), Image.Resampling.LANCZOS))
                 
                 self.bg_canvas.delete("all")
                 self.bg_canvas.create_image(0, 0, image=self.bg_photo, anchor='nw')
@@ -114,6 +161,7 @@ class HealthBarWindow:
                 messagebox.showerror("Error", f"Failed to load image: {str(e)}")
         else:
             self.bg_image_path = None
+            self.bg_image = None
             self.bg_photo = None
             self.bg_canvas.delete("all")
             self.name_label.config(bg='black')
@@ -0,0 +1,194 @@
+import asyncio
+import threading
+import time
+import pytest
+from EventBus import (
+    EventBus, Event, HealthChanged, AbilitiesChanged, AbilityUsed, _CoalescingQueue
+)
+
+
+def _blocked_worker(bus, event_type=Event, threads=None):
+    """Subscribe a thread subscriber that waits on a gate before each delivery."""
+    gate = threading.Event()
+    started = threading.Event()
+    received = []
+
+    def callback(event):
+        if threads is not None:
+            threads.add(threading.current_thread())
+        started.set()
+        gate.wait(5)
+        received.append(event)
+
+    subscription = bus.subscribe(event_type, callback, mode='thread')
+    return subscription, gate, started, received
+
+
+def test_coalescing_queue_keeps_newest_state_in_arrival_order():
+    queue = _CoalescingQueue()
+    queue.put(HealthChanged("Boss", 10, 10))
+    queue.put(AbilityUsed("Bite", 1))
+    queue.put(HealthChanged("Boss", 5, 10))
+    assert queue.take() == [AbilityUsed("Bite", 1), HealthChanged("Boss", 5, 10)]
+    assert queue.take() == []
+
+
+def test_inline_subscriber_runs_on_publishing_thread():
+    bus = EventBus()
+    threads = []
+    bus.subscribe(HealthChanged, lambda event: threads.append(threading.current_thread()))
+    bus.publish(HealthChanged("Boss", 5, 10))
+    assert threads == [threading.current_thread()]
+
+
+def test_inline_subscriber_errors_propagate():
+    bus = EventBus()
+
+    def broken(event):
+        raise KeyError("boom")
+
+    bus.subscribe(HealthChanged, broken)
+    with pytest.raises(KeyError):
+        bus.publish(HealthChanged("Boss", 5, 10))
+
+
+def test_subscribing_to_base_class_receives_subclasses():
+    bus = EventBus()
+    received = []
+    bus.subscribe(Event, received.append)
+    bus.subscribe(AbilityUsed, received.append)
+    bus.publish(HealthChanged("Boss", 5, 10))
+    bus.publish(AbilityUsed("Bite", None))
+    assert received == [HealthChanged("Boss", 5, 10), AbilityUsed("Bite", None), AbilityUsed("Bite", None)]
+
+
+def test_thread_subscriber_runs_on_worker_and_coalesces():
+    bus = EventBus()
+    threads = set()
+    subscription, gate, started, received = _blocked_worker(bus, threads=threads)
+    bus.publish(HealthChanged("Boss", 10, 10))
+    assert started.wait(5)
+
+    # The worker is busy, so these pile up and state events coalesce
+    for current in range(9, 0, -1):
+        bus.publish(HealthChanged("Boss", current, 10))
+    bus.publish(AbilityUsed("Bite", 2))
+    bus.publish(AbilityUsed("Bite", 1))
+    bus.publish(AbilitiesChanged({"Bite": (3, 1)}))
+
+    gate.set()
+    assert bus.close()
+    assert threads == {subscription.dispatcher.thread}
+    assert threading.current_thread() not in threads
+    assert received == [
+        HealthChanged("Boss", 10, 10),
+        HealthChanged("Boss", 1, 10),
+        AbilityUsed("Bite", 2),
+        AbilityUsed("Bite", 1),
+        AbilitiesChanged({"Bite": (3, 1)}),
+    ]
+    assert not subscription.dispatcher.thread.is_alive()
+
+
+def test_thread_subscriber_errors_do_not_stop_worker(capsys):
+    bus = EventBus()
+    received = []
+
+    def callback(event):
+        if event.name == "bad":
+            raise RuntimeError("boom")
+        received.append(event)
+
+    bus.subscribe(AbilityUsed, callback, mode='thread')
+    bus.publish(AbilityUsed("bad"))
+    bus.publish(AbilityUsed("good"))
+    bus.close()
+    assert received == [AbilityUsed("good")]
+    assert "RuntimeError: boom" in capsys.readouterr().err
+
+
+def test_cancel_drains_pending_and_stops_delivery():
+    bus = EventBus()
+    subscription, gate, started, received = _blocked_worker(bus, AbilityUsed)
+    bus.publish(AbilityUsed("First"))
+    assert started.wait(5)
+    bus.publish(AbilityUsed("Second"))
+
+    gate.set()
+    subscription.cancel()
+    bus.publish(AbilityUsed("Third"))
+    subscription.dispatcher.thread.join(5)
+    assert received == [AbilityUsed("First"), AbilityUsed("Second")]
+    assert not subscription.dispatcher.thread.is_alive()
+
+
+def test_cancel_and_close_do_not_wait_for_a_blocked_worker():
+    bus = EventBus()
+    subscription, gate, started, received = _blocked_worker(bus, AbilityUsed)
+    bus.subscribe(HealthChanged, lambda event: gate.wait(5), mode='thread')
+    bus.publish(AbilityUsed("First"))
+    bus.publish(HealthChanged("Boss", 5, 10))
+    assert started.wait(5)
+
+    start = time.monotonic()
+    subscription.cancel()
+    assert time.monotonic() - start < 0.1
+    start = time.monotonic()
+    assert not bus.close(timeout=0.1)
+    assert time.monotonic() - start < 0.5
+
+    gate.set()
+    subscription.dispatcher.thread.join(5)
+    assert received == [AbilityUsed("First")]
+
+
+def test_asyncio_subscriber_runs_on_loop():
+    received = []
+
+    async def main():
+        bus = EventBus()
+        loop = asyncio.get_running_loop()
+
+        async def callback(event):
+            received.append((event, asyncio.get_running_loop() is loop))
+
+        bus.subscribe(HealthChanged, callback, mode='asyncio', loop=loop)
+        bus.publish(HealthChanged("Boss", 9, 10))
+        bus.publish(HealthChanged("Boss", 8, 10))
+        await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    assert received == [(HealthChanged("Boss", 8, 10), True)]
+
+
+def test_asyncio_coroutine_errors_are_logged(capsys):
+    async def main():
+        bus = EventBus()
+
+        async def callback(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(HealthChanged, callback, mode='asyncio', loop=asyncio.get_running_loop())
+        bus.publish(HealthChanged("Boss", 9, 10))
+        await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    err = capsys.readouterr().err
+    assert "RuntimeError: boom" in err
+    assert "never retrieved" not in err
+
+
+def test_closed_asyncio_loop_stops_delivery_without_raising():
+    bus = EventBus()
+    loop = asyncio.new_event_loop()
+    received = []
+    bus.subscribe(HealthChanged, received.append, mode='asyncio', loop=loop)
+    bus.publish(HealthChanged("Boss", 10, 10))
+    loop.run_until_complete(asyncio.sleep(0))
+    assert received == [HealthChanged("Boss", 10, 10)]
+    loop.close()
+
+    # Must not raise into the publisher, and nothing else is delivered
+    bus.publish(HealthChanged("Boss", 9, 10))
+    bus.publish(HealthChanged("Boss", 8, 10))
+    assert received == [HealthChanged("Boss", 10, 10)]
@@ -0,0 +1,84 @@
+import pytest
+from DataManager import DataManager
+from LogicManager import LogicManager
+from EventBus import (
+    Event, HealthChanged, AbilitiesChanged, AbilityUsed, BackgroundChanged,
+    MonsterLoaded, MonsterSaved
+)
+
+
+@pytest.fixture
+def logic():
+    """A LogicManager over a real DataManager, recording every published event."""
+    logic_manager = LogicManager(DataManager())
+    logic_manager.events = []
+    logic_manager.event_bus.subscribe(Event, logic_manager.events.append)
+    return logic_manager
+
+
+def test_damage_and_healing_publish_clamped_health(logic):
+    logic.initialize_monster("Boss", "20")
+    logic.apply_damage("25")
+    logic.apply_healing("5")
+    assert logic.events == [
+        HealthChanged("Boss", 20, 20),
+        HealthChanged("Boss", 0, 20),
+        HealthChanged("Boss", 5, 20),
+    ]
+
+
+def test_invalid_input_publishes_nothing(logic):
+    assert not logic.initialize_monster("Boss", "lots")
+    assert not logic.apply_damage("a bit")
+    assert not logic.add_ability("  ", "1")
+    assert logic.events == []
+
+
+def test_use_ability_publishes_remaining_uses(logic):
+    logic.add_ability("Bite", "2")
+    logic.add_ability("Roar", "")
+    logic.events.clear()
+
+    assert logic.use_ability("Bite")
+    assert logic.use_ability("Roar")
+    assert logic.events == [
+        AbilityUsed("Bite", 1),
+        AbilitiesChanged({"Bite": (2, 1), "Roar": (0, 0)}),
+        AbilityUsed("Roar", None),
+        AbilitiesChanged({"Bite": (2, 1), "Roar": (0, 0)}),
+    ]
+
+
+def test_exhausted_ability_publishes_nothing(logic):
+    logic.add_ability("Bite", "1")
+    logic.use_ability("Bite")
+    logic.events.clear()
+    assert not logic.use_ability("Bite")
+    assert logic.events == []
+
+
+def test_save_and_load_publish_in_order(logic, tmp_path):
+    logic.initialize_monster("Boss", "30")
+    logic.add_ability("Bite", "3")
+    logic.set_background_image("boss.png")
+    logic.apply_damage("10")
+    filename = str(tmp_path / "boss.json")
+    assert logic.save_monster(filename)
+    assert logic.events[-1] == MonsterSaved(filename)
+
+    other = LogicManager(DataManager())
+    events = []
+    other.event_bus.subscribe(Event, events.append)
+    assert other.load_monster(filename)
+    assert events == [
+        HealthChanged("Boss", 20, 30),
+        AbilitiesChanged({"Bite": (3, 3)}),
+        BackgroundChanged("boss.png"),
+        MonsterLoaded(filename, "Boss"),
+    ]
+
+
+def test_failed_save_and_load_publish_nothing(logic, tmp_path):
+    assert not logic.save_monster(str(tmp_path))  # A directory can't be written as a file
+    assert not logic.load_monster(str(tmp_path / "missing.json"))
+    assert logic.events == []
@@ -0,0 +1,217 @@
+import argparse
+import os
+import random
+import threading
+import time
+import pytest
+from PIL import Image
+import Main
+import OverlayRenderer
+from OverlayRenderer import (
+    OverlayRenderer as Renderer, FrameSink, SharedMemorySink, NamedPipeSink,
+    create_sink, create_sinks
+)
+
+WIDTH = 320
+HEIGHT = 180
+
+needs_fifo = pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason="named pipes need os.mkfifo")
+
+
+def _fresh_render(name, current, maximum, background):
+    """Render the given state from scratch."""
+    renderer = Renderer(WIDTH, HEIGHT)
+    renderer.set_background(background)
+    if current is not None:
+        renderer.update_health(current, maximum, name)
+    renderer.render()
+    return renderer.frame.tobytes()
+
+
+def _shm_payload(sink):
+    """Return the header fields and pixel payload of a shared-memory sink."""
+    header = SharedMemorySink.HEADER.unpack_from(sink.shm.buf, 0)
+    payload = bytes(sink.shm.buf[SharedMemorySink.HEADER.size:])
+    return header, payload
+
+
+def test_incremental_render_matches_full_repaint_and_shared_memory():
+    rng = random.Random(1234)
+    backgrounds = [
+        None,
+        Image.effect_noise((800, 600), 64).convert('RGB'),
+        Image.new('RGB', (1024, 512), '#336699'),
+    ]
+    names = ["", "Ornstein", "Smough", "Gwyn, Lord of Cinder", "Artorias the Abysswalker"]
+    sink = SharedMemorySink(f"dnd_test_{os.getpid()}_{time.time_ns()}", WIDTH, HEIGHT)
+    renderer = Renderer(WIDTH, HEIGHT, [sink])
+    name, current, maximum, background = "", None, None, None
+    try:
+        for step in range(200):
+            choice = rng.random()
+            if choice < 0.1:
+                background = rng.choice(backgrounds)
+                renderer.set_background(background)
+            elif choice < 0.3:
+                name = rng.choice(names)
+                maximum = maximum or 100
+                current = 100 if current is None else current
+                renderer.update_health(current, maximum, name)
+            else:
+                maximum = 100
+                # Include death (0 and below) and revival
+                current = rng.choice([rng.randint(-10, 0), rng.randint(1, 100)])
+                renderer.update_health(current, maximum, name)
+
+            renderer.emit()
+            expected = _fresh_render(name, current, maximum, background)
+            assert renderer.frame.tobytes() == expected, f"step {step}"
+
+            (magic, width, height, channels, sequence), payload = _shm_payload(sink)
+            assert (magic, width, height, channels) == (b'DNDO', WIDTH, HEIGHT, 3)
+            assert sequence % 2 == 0
+            assert payload == expected
+    finally:
+        sink.close()
+
+
+def test_shared_memory_sink_leaves_consumer_block_alone():
+    from multiprocessing import shared_memory
+    name = f"dnd_test_{os.getpid()}_{time.time_ns()}"
+    size = SharedMemorySink.HEADER.size + WIDTH * HEIGHT * 3
+    owner = shared_memory.SharedMemory(name=name, create=True, size=size)
+    try:
+        sink = SharedMemorySink(name, WIDTH, HEIGHT)
+        assert not sink.created
+        sink.close()
+        attached = shared_memory.SharedMemory(name=name)
+        attached.close()
+    finally:
+        owner.close()
+        owner.unlink()
+
+
+@needs_fifo
+def test_pipe_sink_without_reader_drops_frames(tmp_path):
+    sink = NamedPipeSink(str(tmp_path / "overlay"))
+    renderer = Renderer(WIDTH, HEIGHT, [sink])
+    start = time.monotonic()
+    for current in range(10):
+        renderer.update_health(current + 1, 10, "Boss")
+        renderer.emit()
+    assert time.monotonic() - start < 1
+    assert sink.fd is None
+    renderer.stop()
+
+
+@needs_fifo
+def test_pipe_sink_stalled_reader_does_not_block_stop(tmp_path):
+    path = str(tmp_path / "overlay")
+    sink = NamedPipeSink(path)
+    reader = os.open(path, os.O_RDONLY | os.O_NONBLOCK)  # Connected, never reads
+    try:
+        renderer = Renderer(WIDTH, HEIGHT, [sink])
+        renderer.update_health(5, 10, "Boss")
+        renderer.start(60)
+        time.sleep(0.2)
+        start = time.monotonic()
+        assert renderer.stop()
+        assert time.monotonic() - start < 0.5
+    finally:
+        os.close(reader)
+
+
+@needs_fifo
+def test_pipe_sink_keeps_frames_aligned_after_partial_write(tmp_path):
+    path = str(tmp_path / "overlay")
+    sink = NamedPipeSink(path)
+    reader = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    frame_size = WIDTH * HEIGHT * 3
+    renderer = Renderer(WIDTH, HEIGHT, [sink])
+    try:
+        # The first frame is larger than the pipe buffer, so it is written partially
+        renderer.update_health(10, 10, "Boss")
+        renderer.emit()
+        first = renderer.frame.tobytes()
+        assert sink._unsent is not None
+
+        rendered = {first}
+        received = b''
+        for current in range(200):
+            renderer.update_health(current % 10 + 1, 10, "Boss")
+            renderer.emit()
+            rendered.add(renderer.frame.tobytes())
+            try:
+                received += os.read(reader, 1 << 20)
+            except BlockingIOError:
+                pass
+            if len(received) >= 3 * frame_size:
+                break
+
+        frames = [received[i:i + frame_size] for i in range(0, 3 * frame_size, frame_size)]
+        assert frames[0] == first
+        assert all(frame in rendered for frame in frames)
+    finally:
+        renderer.stop()
+        os.close(reader)
+
+
+@needs_fifo
+def test_pipe_sink_refuses_regular_file(tmp_path):
+    path = tmp_path / "overlay"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        NamedPipeSink(str(path))
+
+
+def test_stop_leaves_sinks_to_busy_render_thread():
+    release = threading.Event()
+    writing = threading.Event()
+
+    class SlowSink(FrameSink):
+        closed = False
+
+        def write_frame(self, frame, dirty_rects):
+            writing.set()
+            release.wait(5)
+
+        def close(self):
+            self.closed = True
+
+    sink = SlowSink()
+    renderer = Renderer(WIDTH, HEIGHT, [sink])
+    renderer.start(60)
+    assert writing.wait(5)
+    assert not renderer.stop(timeout=0.05)
+    assert not sink.closed
+
+    release.set()
+    renderer._thread.join(5)
+    assert sink.closed
+
+
+@pytest.mark.parametrize("spec", ["bogus:name", "shm:", "png", "", ":path"])
+def test_create_sink_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        create_sink(spec, WIDTH, HEIGHT)
+    with pytest.raises(argparse.ArgumentTypeError):
+        Main.parse_overlay(spec)
+
+
+def test_create_sinks_closes_earlier_sinks_on_failure(tmp_path, monkeypatch):
+    closed = []
+    monkeypatch.setattr(OverlayRenderer.PngSequenceSink, 'close', lambda self: closed.append(self))
+    with pytest.raises(ValueError):
+        create_sinks([f"png:{tmp_path}", "bogus:x"], WIDTH, HEIGHT)
+    assert len(closed) == 1
+
+
+@pytest.mark.parametrize("value", ["1080p", "1920", "1920x", "x1080", "0x1080", "1920x-1", "axb"])
+def test_parse_size_rejects_bad_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        Main.parse_size(value)
+
+
+def test_parse_size_accepts_width_by_height():
+    assert Main.parse_size("1280x720") == (1280, 720)
+    assert Main.parse_size("640X360") == (640, 360)